@@ -9,6 +9,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
 from . import parse_from_template, parse_xml
 from .ns import nsdecls
 from .simpletypes import XsdString
@@ -89,12 +91,18 @@ class CT_Slide(_BaseSlideElement):
     clrMapOvr = ZeroOrOne('p:clrMapOvr', successors=_tag_seq[2:])
     del _tag_seq
 
+    _prototype = None
+
     @classmethod
     def new(cls):
         """
         Return a new ``<p:sld>`` element configured as a base slide shape.
+        The minimal slide XML is parsed only once; each new element is
+        a deep copy of that prototype.
         """
-        return parse_xml(cls._sld_xml())
+        if CT_Slide._prototype is None:
+            CT_Slide._prototype = parse_xml(cls._sld_xml())
+        return deepcopy(CT_Slide._prototype)
 
     @staticmethod
     def _sld_xml():
@@ -96,7 +96,7 @@ class _ImageParts(object):
         """
         Generate a reference to each |ImagePart| object in the package.
         """
-        image_parts = []
+        image_parts = set()
         for rel in self._package.iter_rels():
             if rel.is_external:
                 continue
@@ -105,7 +105,7 @@ class _ImageParts(object):
             image_part = rel.target_part
             if image_part in image_parts:
                 continue
-            image_parts.append(image_part)
+            image_parts.add(image_part)
             yield image_part
 
     def get_or_add_image_part(self, image_file):
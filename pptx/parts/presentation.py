@@ -103,11 +103,10 @@ class PresentationPart(XmlPart):
         forms a continuous sequence starting at 1 (e.g. 1, 2, ... 10, ...).
         The extension is always ``.xml``.
         """
+        related_parts = self.related_parts
         for idx, rId in enumerate(rIds):
-            slide_part = self.related_parts[rId]
-            slide_part.partname = PackURI(
-                '/ppt/slides/slide%d.xml' % (idx+1)
-            )
+            slide_part = related_parts[rId]
+            slide_part.partname = self._slide_partname(idx+1)
 
     def save(self, path_or_stream):
         """
@@ -122,8 +121,9 @@ class PresentationPart(XmlPart):
         Return the slide identifier associated with *slide_part* in this
         presentation.
         """
+        related_parts = self.related_parts
         for sldId in self._element.sldIdLst:
-            if self.related_parts[sldId.rId] is slide_part:
+            if related_parts[sldId.rId] is slide_part:
                 return sldId.id
         raise ValueError('matching slide_part not found')
 
@@ -135,5 +135,13 @@ class PresentationPart(XmlPart):
         for a slide collection containing 8 slides.
         """
         sldIdLst = self._element.get_or_add_sldIdLst()
-        partname_str = '/ppt/slides/slide%d.xml' % (len(sldIdLst)+1)
-        return PackURI(partname_str)
+        return self._slide_partname(len(sldIdLst)+1)
+
+    @staticmethod
+    def _slide_partname(idx):
+        """
+        Return |PackURI| instance containing the partname for the slide at
+        one-based position *idx* in the slide sequence, e.g.
+        ``/ppt/slides/slide3.xml`` for *idx* == 3.
+        """
+        return PackURI('/ppt/slides/slide%d.xml' % idx)
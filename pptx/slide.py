@@ -22,7 +22,7 @@ class _BaseSlide(PartElementProxy):
     Slide object. Provides access to shapes and slide-level properties.
     """
 
-    __slots__ = ()
+    __slots__ = ('_spTree',)
 
     @property
     def name(self):
@@ -38,6 +38,14 @@ class _BaseSlide(PartElementProxy):
         new_value = '' if value is None else value
         self._element.cSld.name = new_value
 
+    @lazyproperty
+    def spTree(self):
+        """
+        The ``<p:spTree>`` element of this slide, the root of its shape tree.
+        The same element instance is returned on each call.
+        """
+        return self._element.spTree
+
 
 class _BaseMaster(_BaseSlide):
     """
@@ -53,7 +61,7 @@ class _BaseMaster(_BaseSlide):
         Instance of |MasterPlaceholders| containing sequence of placeholder
         shapes in this master, sorted in *idx* order.
         """
-        return MasterPlaceholders(self._element.spTree, self)
+        return MasterPlaceholders(self.spTree, self)
 
     @lazyproperty
     def shapes(self):
@@ -61,7 +69,7 @@ class _BaseMaster(_BaseSlide):
         Instance of |MasterShapes| containing sequence of shape objects
         appearing on this slide.
         """
-        return MasterShapes(self._element.spTree, self)
+        return MasterShapes(self.spTree, self)
 
 
 class NotesMaster(_BaseMaster):
@@ -140,7 +148,7 @@ class NotesSlide(_BaseSlide):
         An instance of |NotesSlidePlaceholders| containing the sequence of
         placeholder shapes in this notes slide.
         """
-        return NotesSlidePlaceholders(self.element.spTree, self)
+        return NotesSlidePlaceholders(self.spTree, self)
 
     @lazyproperty
     def shapes(self):
@@ -148,7 +156,7 @@ class NotesSlide(_BaseSlide):
         An instance of |NotesSlideShapes| containing the sequence of shape
         objects appearing on this notes slide.
         """
-        return NotesSlideShapes(self._element.spTree, self)
+        return NotesSlideShapes(self.spTree, self)
 
 
 class Slide(_BaseSlide):
@@ -183,7 +191,7 @@ class Slide(_BaseSlide):
         Instance of |SlidePlaceholders| containing sequence of placeholder
         shapes in this slide.
         """
-        return SlidePlaceholders(self._element.spTree, self)
+        return SlidePlaceholders(self.spTree, self)
 
     @lazyproperty
     def shapes(self):
@@ -191,7 +199,7 @@ class Slide(_BaseSlide):
         Instance of |SlideShapes| containing sequence of shape objects
         appearing on this slide.
         """
-        return SlideShapes(self._element.spTree, self)
+        return SlideShapes(self.spTree, self)
 
     @property
     def slide_id(self):
@@ -233,10 +241,12 @@ class Slides(ParentedElementProxy):
 
     def __iter__(self):
         """
-        Support iteration (e.g. 'for slide in slides:').
+        Support iteration (e.g. 'for slide in slides:'). The slide sequence
+        is captured when iteration begins, so adding a slide inside the loop
+        does not extend the iteration.
         """
-        for sldId in self._sldIdLst:
-            yield self.part.related_slide(sldId.rId)
+        related_slide = self.part.related_slide
+        return iter([related_slide(sldId.rId) for sldId in self._sldIdLst])
 
     def __len__(self):
         """
@@ -268,8 +278,8 @@ class Slides(ParentedElementProxy):
         Map *slide* to an integer representing its zero-based position in
         this slide collection. Raises |ValueError| on *slide* not present.
         """
-        for idx, this_slide in enumerate(self):
-            if this_slide == slide:
+        for idx, sldId in enumerate(self._sldIdLst):
+            if self.part.related_slide(sldId.rId) == slide:
                 return idx
         raise ValueError('%s is not in slide collection' % slide)
 
@@ -302,7 +312,7 @@ class SlideLayout(_BaseSlide):
         Instance of |LayoutPlaceholders| containing sequence of placeholder
         shapes in this slide layout, sorted in *idx* order.
         """
-        return LayoutPlaceholders(self._element.spTree, self)
+        return LayoutPlaceholders(self.spTree, self)
 
     @lazyproperty
     def shapes(self):
@@ -310,7 +320,7 @@ class SlideLayout(_BaseSlide):
         Instance of |LayoutShapes| containing the sequence of shapes
         appearing on this slide layout.
         """
-        return LayoutShapes(self._element.spTree, self)
+        return LayoutShapes(self.spTree, self)
 
     @property
     def slide_master(self):
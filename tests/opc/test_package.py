@@ -775,6 +775,26 @@ class DescribeRelationshipCollection(object):
         assert _rId == rId
         assert len(rels) == 1
 
+    def it_can_find_the_part_with_a_reltype(self, reltype):
+        part = Mock(name='part')
+        rels = RelationshipCollection(None)
+        rels.add_relationship('http://rt-other', Mock(name='other'), 'rId1')
+        rels.add_relationship(reltype, part, 'rId2')
+        assert rels.part_with_reltype(reltype) is part
+
+    def it_raises_on_part_with_reltype_not_found(self, reltype):
+        rels = RelationshipCollection(None)
+        rels.add_relationship('http://rt-other', Mock(name='other'), 'rId1')
+        with pytest.raises(KeyError):
+            rels.part_with_reltype(reltype)
+
+    def it_raises_on_part_with_reltype_not_unique(self, reltype):
+        rels = RelationshipCollection(None)
+        for n in range(1, 4):
+            rels.add_relationship(reltype, Mock(name='part'), 'rId%d' % n)
+        with pytest.raises(ValueError):
+            rels.part_with_reltype(reltype)
+
     def it_can_compose_rels_xml(self, rels, rels_elm):
         # exercise ---------------------
         rels.xml
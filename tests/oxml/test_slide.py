@@ -10,7 +10,7 @@ from __future__ import (
 
 import pytest
 
-from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide
+from pptx.oxml.slide import CT_NotesMaster, CT_NotesSlide, CT_Slide
 
 from ..unitutil.file import snippet_text
 
@@ -43,3 +43,14 @@ class DescribeCT_NotesSlide(object):
     def new_fixture(self):
         expected_xml = snippet_text('default-notes')
         return expected_xml
+
+
+class DescribeCT_Slide(object):
+
+    def it_creates_a_distinct_element_on_each_call(self):
+        sld = CT_Slide.new()
+        sld.cSld.name = 'foobar'
+        new_sld = CT_Slide.new()
+        assert new_sld is not sld
+        assert new_sld.cSld.name == ''
+        assert new_sld.xml == CT_Slide.new().xml
@@ -42,6 +42,13 @@ class Describe_BaseSlide(object):
         base_slide.name = new_value
         assert base_slide._element.xml == expected_xml
 
+    def it_provides_access_to_its_spTree(self):
+        sld = element('p:sld/p:cSld/p:spTree')
+        base_slide = _BaseSlide(sld, None)
+        spTree = base_slide.spTree
+        assert spTree is sld.cSld.spTree
+        assert base_slide.spTree is spTree
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -428,6 +435,18 @@ class DescribeSlides(object):
         index = slides.index(slide)
         assert index == expected_value
 
+    def it_stops_resolving_slides_at_the_match(self, part_prop_):
+        sldIdLst = element('p:sldIdLst/(p:sldId{r:id=a},p:sldId{r:id=b})')
+        slides = Slides(sldIdLst, None)
+        slide = Slide(element('p:sld'), None)
+        related_slide_ = part_prop_.return_value.related_slide
+        related_slide_.return_value = slide
+
+        index = slides.index(slide)
+
+        assert index == 0
+        assert related_slide_.call_args_list == [call('a')]
+
     def it_raises_on_slide_not_in_collection(self, raises_fixture):
         slides, slide = raises_fixture
         with pytest.raises(ValueError):
@@ -439,6 +458,16 @@ class DescribeSlides(object):
         assert related_slide_.call_args_list == calls
         assert slide_lst == expected_value
 
+    def it_captures_the_slide_sequence_when_iteration_begins(
+            self, iter_fixture):
+        slides, related_slide_, calls, expected_value = iter_fixture
+        slide_lst = []
+        for slide in slides:
+            slides._sldIdLst.add_sldId('c')
+            slide_lst.append(slide)
+        assert related_slide_.call_args_list == calls
+        assert slide_lst == expected_value
+
     def it_supports_len(self, len_fixture):
         slides, expected_value = len_fixture
         assert len(slides) == expected_value